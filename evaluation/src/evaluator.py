@@ -5,21 +5,28 @@ Fact-checks and scores AI-generated research reports using Gemini and web search
 """
 
 import os
+import io
 import sys
 import json
 import argparse
 import asyncio
 import re
+import hashlib
+import functools
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, ClassVar, Sequence, Union, Callable
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-import markdown
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +35,168 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')  # Default to GPT-3.5
 
+# On-disk cache for OpenAI responses and rendered Markdown; set to an empty
+# string to disable
+CACHE_DIR = os.getenv('REPORT_EVAL_CACHE_DIR', str(Path.home() / '.cache' / 'report_eval'))
+SEARCH_CACHE_SIZE = 512
+
+# Conjunctions that join independent sub-facts inside one claim
+_CLAIM_SPLIT_RE = re.compile(r'\s*;\s*|,?\s+and\s+', re.IGNORECASE)
+# Query phrases that name a topic the answer must cover
+_MUST_INCLUDE_RE = re.compile(r'\b(?:include|cover|explain|describe)\s+(\w+)')
+# A sentence worth checking: more than 20 characters up to a terminator
+_SENT_RE = re.compile(r'[^.!?\s][^.!?]{20,}')
+
+# Fact-check instructions, shared by every claim so only the claim and its
+# sources vary between requests
+_VERDICT_RULES = (
+    "supported: sources clearly support the claim; "
+    "contradicted: sources contradict the claim; "
+    "insufficient: not enough evidence to determine."
+)
+_FACT_CHECK_SYSTEM = (
+    "You are a fact-checking assistant. Given a claim and numbered sources, "
+    f"decide if the claim is {_VERDICT_RULES} "
+    'Always respond with valid JSON only: {"verdict": "supported|contradicted|insufficient", '
+    '"confidence": 0.0 to 1.0, "rationale": "brief explanation"}'
+)
+_FACT_CHECK_USER_TMPL = "Claim: {claim}\nSources:\n{sources}"
+_BATCH_FACT_CHECK_SYSTEM = (
+    "You are a fact-checking assistant. For each numbered claim, use its numbered sources "
+    f"to decide if the claim is {_VERDICT_RULES} "
+    'Always respond with valid JSON only: {"verdicts": [{"index": claim number, '
+    '"verdict": "supported|contradicted|insufficient", "confidence": 0.0 to 1.0, '
+    '"rationale": "brief explanation"}]} with one entry per claim.'
+)
+_BATCH_CLAIM_TMPL = "Claim {index}: {claim}\nSources:\n{sources}"
+
+def _format_sources(results: List[Dict[str, str]]) -> str:
+    """Render search results as compact numbered lines for a prompt"""
+    return "\n".join(
+        f"[{i}] {r['title']} — {r['url']} — {r['snippet'][:200]}"
+        for i, r in enumerate(results, 1)
+    )
+
+def _merge_sources(result_lists: Sequence[List[Dict[str, str]]],
+                   limit: int) -> List[Dict[str, str]]:
+    """Interleave result lists into at most `limit` sources with distinct URLs"""
+    # Round-robin so every list contributes before any gets a second slot;
+    # a fixed budget keeps scores and prompt size independent of how many
+    # providers are configured
+    merged = []
+    seen_urls = set()
+    for result in itertools.chain.from_iterable(itertools.zip_longest(*result_lists)):
+        if result is not None and result['url'] not in seen_urls:
+            seen_urls.add(result['url'])
+            merged.append(result)
+            if len(merged) == limit:
+                break
+    return merged
+
+def _pooled_session() -> requests.Session:
+    """Create a session that keeps connections alive across calls"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+    return session
+
+def _json_loads(data):
+    """Decode JSON with orjson, falling back to the more lenient stdlib parser"""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+# Markdown renderer configuration; part of the rendered-HTML cache key
+_MD_PRESET = "commonmark"
+_MD_RULES = ("table", "strikethrough")
+
+@functools.lru_cache(maxsize=None)
+def _markdown_renderer():
+    """Markdown renderer for the HTML report, imported and built on first use"""
+    from markdown_it import MarkdownIt
+    return MarkdownIt(_MD_PRESET).enable(list(_MD_RULES))
+
+@functools.lru_cache(maxsize=None)
+def _markdown_cache_salt() -> bytes:
+    """Renderer version and options, so an upgrade or config change misses the disk cache"""
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        renderer_version = version("markdown-it-py")
+    except PackageNotFoundError:
+        from markdown_it import __version__ as renderer_version
+    return f"markdown-it-py {renderer_version} {_MD_PRESET} {','.join(_MD_RULES)}\n".encode()
+
+@functools.lru_cache(maxsize=256)
+def _convert_md_cached(md_text: str) -> str:
+    """Render Markdown to HTML, reusing earlier renders of identical text"""
+    # Rendering is deterministic, so the renderer settings plus the Markdown
+    # make a complete disk-cache key
+    cache_path = None
+    if CACHE_DIR:
+        key = hashlib.blake2b(
+            _markdown_cache_salt() + md_text.encode('utf-8'), digest_size=16
+        ).hexdigest()
+        cache_path = Path(CACHE_DIR) / "md" / f"{key}.html"
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+    
+    html = _markdown_renderer().render(md_text)
+    if cache_path:
+        try:
+            _write_atomic(cache_path, html)
+        except OSError as e:
+            print(f"Warning: could not cache rendered Markdown: {e}")
+    return html
+
+@functools.lru_cache(maxsize=1024)
+def _word_set(text: str) -> frozenset:
+    """Lower-cased word set of a text, memoized since snippets repeat across claims"""
+    return frozenset(text.lower().split())
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file so concurrent readers never see a partial result"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread too: parallel fallbacks can write the same key at once
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+def _iter_json_array_items(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield each object inside a JSON array as soon as its closing brace arrives"""
+    # The array may be the root value or nested, as in {"claims": [...]}
+    open_containers = []
+    in_string = escaped = False
+    item_depth = None
+    item_chars = []
+    
+    for chunk in chunks:
+        for ch in chunk:
+            if item_depth is not None:
+                item_chars.append(ch)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '{[':
+                if (ch == '{' and item_depth is None and open_containers
+                        and open_containers[-1] == '['):
+                    item_depth = len(open_containers)
+                    item_chars = [ch]
+                open_containers.append(ch)
+            elif ch in '}]':
+                if open_containers:
+                    open_containers.pop()
+                if ch == '}' and len(open_containers) == item_depth:
+                    yield _json_loads(''.join(item_chars))
+                    item_depth = None
+
 class SearchProvider(Enum):
     """Supported search providers"""
     TAVILY = "tavily"
@@ -35,7 +204,7 @@ class SearchProvider(Enum):
     BING = "bing"
     GOOGLE = "google"  # Using existing Google implementation
 
-@dataclass
+@dataclass(slots=True)
 class Criteria:
     """Evaluation criteria extracted from user query"""
     goals: List[str]
@@ -44,14 +213,14 @@ class Criteria:
     nice_to_have: List[str]
     disallowed: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """Individual verifiable claim"""
     claim_text: str
     evidence_needed: str
     priority: str
     
-@dataclass
+@dataclass(slots=True)
 class FactCheckResult:
     """Result of fact-checking a claim"""
     claim: str
@@ -60,7 +229,10 @@ class FactCheckResult:
     rationale: str
     sources: List[Dict[str, str]]
 
-@dataclass
+# Serialized fact-check fields, in output order (slots leave no __dict__)
+_FC_FIELDS = ("claim", "verdict", "confidence", "rationale", "sources")
+
+@dataclass(slots=True)
 class EvaluationScore:
     """Overall evaluation scores"""
     accuracy: float
@@ -69,21 +241,61 @@ class EvaluationScore:
     clarity_structure: float
     overall: float
     
+    # Weights for accuracy, coverage, citations_quality, clarity_structure
+    _WEIGHTS: ClassVar[Tuple[float, ...]] = (0.45, 0.30, 0.15, 0.10)
+    
     def calculate_overall(self):
         """Calculate weighted overall score"""
-        self.overall = (
-            0.45 * self.accuracy +
-            0.30 * self.coverage +
-            0.15 * self.citations_quality +
-            0.10 * self.clarity_structure
-        )
+        self.overall = sum(w * v for w, v in zip(self._WEIGHTS, (
+            self.accuracy,
+            self.coverage,
+            self.citations_quality,
+            self.clarity_structure
+        )))
         return self.overall
+    
+    @classmethod
+    def calculate_overall_batch(cls, scores: Sequence[Sequence[float]]) -> List[float]:
+        """Weighted overall scores for many (accuracy, coverage, citations, clarity) rows"""
+        return [sum(w * v for w, v in zip(cls._WEIGHTS, row)) for row in scores]
+
+def _compile_encoder(cls):
+    """Generate a JSON encoder specialised to a dataclass's fixed fields"""
+    # Keys are baked into the source and floats are written with repr(); that
+    # is valid JSON but not always orjson's spelling (1e-05 vs 0.00001)
+    parts = []
+    for f in fields(cls):  # skips ClassVar entries of __dataclass_fields__
+        key = orjson.dumps(f.name)
+        parts.append(repr((b"," if parts else b"{") + key + b":"))
+        if f.type is float:
+            parts.append(f"repr(float(obj.{f.name})).encode()")
+        else:
+            parts.append(f"_dumps(obj.{f.name})")
+    parts.append(repr(b"}"))
+    func_name = f"_encode_{cls.__name__}"
+    source = f"def {func_name}(obj):\n    return b''.join(({', '.join(parts)},))\n"
+    namespace = {"_dumps": orjson.dumps}
+    exec(compile(source, f"<{func_name}>", "exec"), namespace)
+    return namespace[func_name]
+
+_encode_score = _compile_encoder(EvaluationScore)
+_encode_criteria = _compile_encoder(Criteria)
 
 class SearchManager:
     """Manages web searches across different providers"""
     
     def __init__(self):
         self.providers = self._detect_available_providers()
+        self._session = _pooled_session()
+        self._cache: Dict[Tuple[SearchProvider, str, int], List[Dict[str, str]]] = {}
+        # search_all fills the cache from several worker threads
+        self._cache_lock = threading.Lock()
+        self._dispatch = {
+            SearchProvider.GOOGLE: self._search_google,
+            SearchProvider.TAVILY: self._search_tavily,
+            SearchProvider.SERPAPI: self._search_serpapi,
+            SearchProvider.BING: self._search_bing,
+        }
         
     def _detect_available_providers(self) -> List[SearchProvider]:
         """Detect which search providers are configured"""
@@ -104,18 +316,45 @@ class SearchManager:
             print("Warning: No search providers configured. Using mock data.")
             return self._mock_search(query)
         
-        provider = self.providers[0]
-        
-        if provider == SearchProvider.GOOGLE:
-            return self._search_google(query, num_results)
-        elif provider == SearchProvider.TAVILY:
-            return self._search_tavily(query, num_results)
-        elif provider == SearchProvider.SERPAPI:
-            return self._search_serpapi(query, num_results)
-        elif provider == SearchProvider.BING:
-            return self._search_bing(query, num_results)
+        return self._search_provider(self.providers[0], query, num_results)
+    
+    async def search_all(self, query: str, num_results: int = 4) -> List[Dict[str, str]]:
+        """Query every configured provider in parallel and merge the top results by URL"""
+        if not self.providers:
+            return await self.search_async(query, num_results)
         
-        return []
+        result_lists = await asyncio.gather(*[
+            asyncio.to_thread(self._search_provider, provider, query, num_results)
+            for provider in self.providers
+        ])
+        return _merge_sources(result_lists, num_results)
+    
+    def _search_provider(self, provider: SearchProvider, query: str,
+                         num_results: int) -> List[Dict[str, str]]:
+        """Search with one provider, answering repeat queries from the cache"""
+        cache_key = (provider, query, num_results)
+        with self._cache_lock:
+            cached = self._cache.pop(cache_key, None)
+            if cached is not None:
+                # Re-insert so the dict order runs from least to most recently used
+                self._cache[cache_key] = cached
+        if cached is not None:
+            return list(cached)
+        
+        results = self._dispatch[provider](query, num_results)
+        
+        # Failed searches come back empty; don't pin those in the cache
+        if results:
+            with self._cache_lock:
+                self._cache.pop(cache_key, None)
+                if len(self._cache) >= SEARCH_CACHE_SIZE:
+                    self._cache.pop(next(iter(self._cache)))  # least recently used
+                self._cache[cache_key] = results
+        return list(results)
+    
+    async def search_async(self, query: str, num_results: int = 4) -> List[Dict[str, str]]:
+        """Run search on a worker thread so several queries can overlap"""
+        return await asyncio.to_thread(self.search, query, num_results)
     
     def _search_google(self, query: str, num_results: int) -> List[Dict[str, str]]:
         """Search using Google Custom Search API"""
@@ -131,9 +370,9 @@ class SearchManager:
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             results = []
             for item in data.get('items', []):
@@ -159,9 +398,9 @@ class SearchManager:
         }
         
         try:
-            response = requests.post(url, json=payload)
+            response = self._session.post(url, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             results = []
             for result in data.get('results', []):
@@ -188,9 +427,9 @@ class SearchManager:
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             results = []
             for result in data.get('organic_results', []):
@@ -213,9 +452,9 @@ class SearchManager:
         params = {"q": query, "count": num_results}
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._session.get(url, headers=headers, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             results = []
             for result in data.get('webPages', {}).get('value', []):
@@ -244,6 +483,126 @@ class SearchManager:
             }
         ]
 
+class _SafeDict(dict):
+    """format_map mapping that renders unknown placeholders as empty strings"""
+    def __missing__(self, key):
+        return ""
+
+# Static <head> of the HTML report
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Evaluation Report</title>
+    <style>
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            max-width: 900px; 
+            margin: 0 auto; 
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .container {
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1, h2, h3 { color: #333; }
+        .score-badge {
+            display: inline-block;
+            padding: 5px 15px;
+            border-radius: 20px;
+            font-weight: bold;
+            margin: 5px;
+        }
+        .score-good { background: #4caf50; color: white; }
+        .score-medium { background: #ff9800; color: white; }
+        .score-poor { background: #f44336; color: white; }
+        .fact-check {
+            margin: 10px 0;
+            padding: 15px;
+            border-left: 4px solid #2196F3;
+            background: #f0f8ff;
+        }
+        .verdict-supported { border-color: #4caf50; background: #e8f5e9; }
+        .verdict-contradicted { border-color: #f44336; background: #ffebee; }
+        .verdict-insufficient { border-color: #ff9800; background: #fff3e0; }
+        pre { background: #f4f4f4; padding: 10px; overflow-x: auto; }
+        .toggle-section {
+            cursor: pointer;
+            user-select: none;
+            padding: 10px;
+            background: #e0e0e0;
+            margin: 10px 0;
+        }
+        .toggle-content {
+            display: none;
+            padding: 10px;
+            border: 1px solid #ddd;
+        }
+        .toggle-content.active {
+            display: block;
+        }
+    </style>
+</head>
+"""
+# Per-report part of the page, filled in with str.format_map
+_HTML_BODY_TMPL = """<body>
+    <div class="container">
+        <h1>Evaluation Report</h1>
+        <p>Generated: {generated_at}</p>
+        
+        <h2>Query</h2>
+        <p>{query}</p>
+        
+        <h2>Evaluation Scores</h2>
+        <p>
+            <span class="score-badge {score_class}">
+                Overall: {overall:.2f}/5.00
+            </span>
+        </p>
+        <ul>
+            <li>Accuracy: {accuracy:.2f}/5.00 (45% weight)</li>
+            <li>Coverage: {coverage:.2f}/5.00 (30% weight)</li>
+            <li>Citations Quality: {citations_quality:.2f}/5.00 (15% weight)</li>
+            <li>Clarity & Structure: {clarity_structure:.2f}/5.00 (10% weight)</li>
+        </ul>
+        
+        <h2>Fact-Check Results</h2>
+        <p>Checked {claims_checked} claims:</p>
+{fact_checks_html}{fixed_html}
+    </div>
+"""
+# Script for the collapsible auto-fixed section
+_TOGGLE_JS = """    <script>
+        function toggleSection(id) {
+            const content = document.getElementById(id);
+            content.classList.toggle('active');
+            const toggle = content.previousElementSibling;
+            toggle.textContent = content.classList.contains('active') ? 
+                '▼ Hide Auto-Fixed Version' : '▶ Show Auto-Fixed Version';
+        }
+    </script>
+"""
+_HTML_FOOTER = """</body>
+</html>
+"""
+_HTML_FACT_CHECK_TMPL = """
+        <div class="fact-check verdict-{verdict}">
+            <strong>Claim {index}:</strong> {claim}...<br>
+            <strong>Verdict:</strong> {verdict} (confidence: {confidence:.2f})<br>
+            <strong>Rationale:</strong> {rationale}
+        </div>
+"""
+_HTML_FIXED_TMPL = """
+        <div class="toggle-section" onclick="toggleSection('fixed')">
+            ▶ Show Auto-Fixed Version
+        </div>
+        <div id="fixed" class="toggle-content">
+            {fixed_html}
+        </div>
+"""
+
 class ReportEvaluator:
     """Main evaluator class for AI-generated research reports"""
     
@@ -252,6 +611,103 @@ class ReportEvaluator:
         self.api_key = OPENAI_API_KEY
         self.model = OPENAI_MODEL
         self.api_url = "https://api.openai.com/v1/chat/completions"
+        self._session = _pooled_session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        if self.api_key:
+            self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+    
+    def _chat_payload(self, system: str, prompt: str, temperature: float,
+                      json_mode: bool = False) -> Tuple[Dict[str, Any], Optional[Path]]:
+        """Build a chat completion request and the cache file that answers it"""
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature
+        }
+        if json_mode:
+            # Guarantees a parseable JSON object (never an array or fenced text)
+            data["response_format"] = {"type": "json_object"}
+        
+        cache_path = None
+        if CACHE_DIR:
+            key = hashlib.blake2b(
+                orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16
+            ).hexdigest()
+            cache_path = Path(CACHE_DIR) / "llm" / f"{key}.txt"
+        return data, cache_path
+    
+    def _read_cached(self, cache_path: Optional[Path]) -> Optional[str]:
+        """Return a cached OpenAI response, if there is one"""
+        if not cache_path:
+            return None
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def _store_cached(self, cache_path: Optional[Path], content: str) -> None:
+        """Remember an OpenAI response for identical future requests"""
+        if not cache_path:
+            return
+        try:
+            _write_atomic(cache_path, content)
+        except OSError as e:
+            print(f"Warning: could not cache OpenAI response: {e}")
+    
+    def _discard_cached(self, cache_path: Optional[Path]) -> None:
+        """Forget a cached OpenAI response that turned out to be unusable"""
+        if cache_path:
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def _chat_completion(self, system: str, prompt: str, temperature: float,
+                         json_mode: bool = False,
+                         parse: Optional[Callable[[str], Any]] = None,
+                         use_cache: bool = True) -> Any:
+        """Send a chat completion request, reusing cached answers for identical prompts"""
+        # parse turns the answer into the caller's result; only answers it
+        # accepts are cached, so a malformed one is not replayed on later runs
+        data, cache_path = self._chat_payload(system, prompt, temperature, json_mode)
+        if not use_cache:
+            cache_path = None
+        cached = self._read_cached(cache_path)
+        if cached is not None:
+            try:
+                return parse(cached) if parse else cached
+            except Exception:
+                self._discard_cached(cache_path)
+        
+        response = self._session.post(self.api_url, json=data)
+        response.raise_for_status()
+        content = orjson.loads(response.content)['choices'][0]['message']['content']
+        result = parse(content) if parse else content
+        self._store_cached(cache_path, content)
+        return result
+    
+    def _chat_completion_stream(self, data: Dict[str, Any],
+                                parts: List[str]) -> Iterator[str]:
+        """Stream a chat completion, yielding content fragments as they arrive"""
+        # Fragments also go to parts, so the caller can cache the whole
+        # answer once it has checked it
+        data = {**data, "stream": True}
+        with self._session.post(self.api_url, json=data, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                # Server-sent events: "data: {...}" lines, closed by "data: [DONE]"
+                if not line.startswith(b"data: "):
+                    continue
+                event = line[len(b"data: "):]
+                if event == b"[DONE]":
+                    break
+                delta = orjson.loads(event)['choices'][0]['delta'].get('content')
+                if delta:
+                    parts.append(delta)
+                    yield delta
     
     def extract_criteria(self, user_query: str) -> Criteria:
         """Extract evaluation criteria from user query using OpenAI"""
@@ -273,32 +729,21 @@ class ReportEvaluator:
         """
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant that extracts evaluation criteria from queries. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3
-            }
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
-            text = response.json()['choices'][0]['message']['content'].strip()
-            # Clean the response text to extract JSON
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            criteria_dict = json.loads(text)
-            return Criteria(**criteria_dict)
+            return self._chat_completion(
+                "You are a helpful assistant that extracts evaluation criteria from queries. Always respond with valid JSON only.",
+                prompt,
+                temperature=0,
+                json_mode=True,
+                parse=lambda text: Criteria(**_json_loads(text))
+            )
         except Exception as e:
             print(f"OpenAI criteria extraction failed: {e}")
             return self._extract_criteria_basic(user_query)
     
+    async def extract_criteria_async(self, user_query: str) -> Criteria:
+        """Extract criteria on a worker thread without blocking the event loop"""
+        return await asyncio.to_thread(self.extract_criteria, user_query)
+    
     def _extract_criteria_basic(self, user_query: str) -> Criteria:
         """Basic criteria extraction without AI"""
         query_lower = user_query.lower()
@@ -311,7 +756,7 @@ class ReportEvaluator:
         if 'how' in query_lower:
             goals.append("Provide actionable instructions")
         
-        must_include = re.findall(r'\b(?:include|cover|explain|describe)\s+(\w+)', query_lower)
+        must_include = _MUST_INCLUDE_RE.findall(query_lower)
         
         return Criteria(
             goals=goals or ["Answer the user's question comprehensively"],
@@ -323,8 +768,13 @@ class ReportEvaluator:
     
     def extract_claims(self, draft: str) -> List[Claim]:
         """Extract verifiable claims from the assistant's draft"""
+        return list(self.iter_claims(draft))
+    
+    def iter_claims(self, draft: str) -> Iterator[Claim]:
+        """Yield claims from the draft as soon as the model emits each one"""
         if not self.api_key:
-            return self._extract_claims_basic(draft)
+            yield from self._extract_claims_basic(draft)
+            return
         
         prompt = f"""
         Extract verifiable claims (short, atomic statements) from this draft.
@@ -336,56 +786,55 @@ class ReportEvaluator:
         Draft:
         {draft[:3000]}  # Limit for API
         
-        Return JSON array of claims.
+        Return a JSON object with a "claims" array of these objects.
         """
         
+        data, cache_path = self._chat_payload(
+            "You are a helpful assistant that extracts verifiable claims from text. Always respond with valid JSON only.",
+            prompt,
+            temperature=0,
+            json_mode=True
+        )
+        cached = self._read_cached(cache_path)
+        parts = []
+        found_any = False
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant that extracts verifiable claims from text. Always respond with a valid JSON array only."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3
-            }
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
-            text = response.json()['choices'][0]['message']['content'].strip()
-            # Clean the response text to extract JSON
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            claims_data = json.loads(text)
-            return [Claim(**claim) for claim in claims_data]
+            if cached is not None:
+                chunks = [cached]
+            else:
+                chunks = self._chat_completion_stream(data, parts)
+            for claim in _iter_json_array_items(chunks):
+                found_any = True
+                yield Claim(**claim)
+            # Cache only complete answers that produced claims; a stream cut
+            # off mid-array still yields its finished items
+            if cached is None and found_any:
+                text = ''.join(parts)
+                try:
+                    _json_loads(text)
+                except ValueError:
+                    pass
+                else:
+                    self._store_cached(cache_path, text)
         except Exception as e:
             print(f"OpenAI claim extraction failed: {e}")
-            return self._extract_claims_basic(draft)
+            if cached is not None:
+                self._discard_cached(cache_path)
+            # Claims already handed out stay valid; only fall back if none were
+            if not found_any:
+                yield from self._extract_claims_basic(draft)
     
     def _extract_claims_basic(self, draft: str) -> List[Claim]:
         """Basic claim extraction using regex patterns"""
         claims = []
         
-        # Look for statements with specific patterns
-        patterns = [
-            r'(?:is|are|was|were|has|have|can|will)\s+([^.!?]+)[.!?]',
-            r'(?:provides?|offers?|includes?|supports?)\s+([^.!?]+)[.!?]',
-            r'(?:\d+%|\d+\s+(?:times|percent|million|billion))[^.!?]+[.!?]'
-        ]
-        
-        sentences = draft.split('.')
-        for sentence in sentences[:20]:  # Limit to first 20 sentences
-            sentence = sentence.strip()
-            if len(sentence) > 20:
-                claims.append(Claim(
-                    claim_text=sentence,
-                    evidence_needed="Web search verification",
-                    priority="medium"
-                ))
+        for match in itertools.islice(_SENT_RE.finditer(draft), 20):  # Limit to first 20 sentences
+            sentence = match.group().rstrip()
+            claims.append(Claim(
+                claim_text=sentence,
+                evidence_needed="Web search verification",
+                priority="medium"
+            ))
         
         return claims[:10]  # Limit total claims
     
@@ -393,57 +842,21 @@ class ReportEvaluator:
         """Fact-check a single claim using web search"""
         # Search for evidence
         search_results = self.search_manager.search(claim.claim_text, num_results=3)
-        
+        return self._verify_claim(claim, search_results)
+    
+    def _verify_claim(self, claim: Claim, search_results: List[Dict[str, str]]) -> FactCheckResult:
+        """Judge a single claim against already-retrieved sources"""
         if not self.api_key:
             # Basic fact-checking without AI
             return self._fact_check_basic(claim, search_results)
         
-        # Prepare sources for Gemini
-        sources_text = "\n".join([
-            f"Source {i+1}: {r['title']}\nURL: {r['url']}\nSnippet: {r['snippet']}"
-            for i, r in enumerate(search_results)
-        ])
-        
-        prompt = f"""
-        Given this claim and these sources, determine if the claim is:
-        - supported: sources clearly support the claim
-        - contradicted: sources contradict the claim  
-        - insufficient: not enough evidence to determine
-        
-        Claim: {claim.claim_text}
-        
-        Sources:
-        {sources_text}
-        
-        Return JSON with:
-        - verdict: supported|contradicted|insufficient
-        - confidence: 0.0 to 1.0
-        - rationale: brief explanation
-        """
+        prompt = _FACT_CHECK_USER_TMPL.format(
+            claim=claim.claim_text,
+            sources=_format_sources(search_results)
+        )
         
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are a fact-checking assistant. Analyze claims and determine if they are supported, contradicted, or have insufficient evidence. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3
-            }
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
-            text = response.json()['choices'][0]['message']['content'].strip()
-            # Clean the response text to extract JSON
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            result = json.loads(text)
-            
+        def parse(text):
+            result = _json_loads(text)
             return FactCheckResult(
                 claim=claim.claim_text,
                 verdict=result.get('verdict', 'insufficient'),
@@ -451,21 +864,130 @@ class ReportEvaluator:
                 rationale=result.get('rationale', 'Unable to determine'),
                 sources=search_results
             )
+        
+        try:
+            return self._chat_completion(
+                _FACT_CHECK_SYSTEM,
+                prompt,
+                temperature=0,
+                json_mode=True,
+                parse=parse
+            )
         except Exception as e:
             print(f"OpenAI fact-check failed: {e}")
             return self._fact_check_basic(claim, search_results)
     
+    def _decompose_claim(self, claim_text: str) -> List[str]:
+        """Split a compound claim into at most three searchable sub-facts"""
+        parts = [p.strip(' .') for p in _CLAIM_SPLIT_RE.split(claim_text)]
+        # Parts under three words ("Rust and C++ compile to WebAssembly")
+        # don't search well alone, so such claims stay whole
+        if len(parts) < 2 or any(len(p.split()) < 3 for p in parts):
+            return [claim_text]
+        if len(parts) > 3:
+            # Fold the remaining sub-facts into the last query rather than drop them
+            parts = parts[:2] + [' '.join(parts[2:])]
+        return parts
+    
+    async def _search_claim_async(self, claim: Claim, num_results: int = 3) -> List[Dict[str, str]]:
+        """Search every sub-fact of a claim on every provider in parallel and merge the sources"""
+        subqueries = self._decompose_claim(claim.claim_text)
+        result_lists = await asyncio.gather(*[
+            self.search_manager.search_all(q, num_results) for q in subqueries
+        ])
+        return _merge_sources(result_lists, num_results)
+    
+    async def _extract_and_fact_check_async(self, draft: str,
+                                            limit: int = 10) -> Tuple[List[Claim], List[FactCheckResult]]:
+        """Extract claims and fact-check the first `limit`, searching as each arrives"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        def produce():
+            try:
+                for claim in self.iter_claims(draft):
+                    loop.call_soon_threadsafe(queue.put_nowait, claim)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+        
+        producer = loop.run_in_executor(None, produce)
+        claims = []
+        searches = []
+        while (claim := await queue.get()) is not done:
+            claims.append(claim)
+            if len(searches) < limit:
+                searches.append(asyncio.create_task(self._search_claim_async(claim)))
+        await producer
+        
+        sources_per_claim = await asyncio.gather(*searches)
+        fact_checks = await self._verify_claims_async(claims[:limit], sources_per_claim)
+        return claims, fact_checks
+    
+    async def _verify_claims_async(self, claims: List[Claim],
+                                   sources_per_claim: List[List[Dict[str, str]]]) -> List[FactCheckResult]:
+        """Judge claims against their sources, batching the OpenAI calls"""
+        if self.api_key and claims:
+            try:
+                return await asyncio.to_thread(
+                    self._fact_check_claims_batch, claims, sources_per_claim
+                )
+            except Exception as e:
+                # Fall back to one request per claim
+                print(f"OpenAI batch fact-check failed, checking claims individually: {e}")
+        
+        tasks = [
+            asyncio.to_thread(self._verify_claim, claim, sources)
+            for claim, sources in zip(claims, sources_per_claim)
+        ]
+        return list(await asyncio.gather(*tasks))
+    
+    def _fact_check_claims_batch(self, claims: List[Claim],
+                                 sources_per_claim: List[List[Dict[str, str]]]) -> List[FactCheckResult]:
+        """Fact-check several claims with a single OpenAI request"""
+        # Raises on a malformed or incomplete answer so the caller can fall back
+        prompt = "\n\n".join(
+            _BATCH_CLAIM_TMPL.format(
+                index=i, claim=claim.claim_text, sources=_format_sources(sources)
+            )
+            for i, (claim, sources) in enumerate(zip(claims, sources_per_claim), 1)
+        )
+        
+        def parse(text):
+            verdicts = {int(v['index']): v for v in _json_loads(text)['verdicts']}
+            results = []
+            for i, (claim, sources) in enumerate(zip(claims, sources_per_claim), 1):
+                if i not in verdicts:
+                    raise ValueError(f"no verdict returned for claim {i}")
+                result = verdicts[i]
+                results.append(FactCheckResult(
+                    claim=claim.claim_text,
+                    verdict=result.get('verdict', 'insufficient'),
+                    confidence=float(result.get('confidence', 0.5)),
+                    rationale=result.get('rationale', 'Unable to determine'),
+                    sources=sources
+                ))
+            return results
+        
+        return self._chat_completion(
+            _BATCH_FACT_CHECK_SYSTEM,
+            prompt,
+            temperature=0,
+            json_mode=True,
+            parse=parse
+        )
+    
     def _fact_check_basic(self, claim: Claim, sources: List[Dict]) -> FactCheckResult:
         """Basic fact-checking without AI"""
         # Simple keyword matching
-        claim_words = set(claim.claim_text.lower().split())
+        claim_words = _word_set(claim.claim_text)
         
         match_count = 0
-        for source in sources:
-            snippet_words = set(source['snippet'].lower().split())
-            overlap = len(claim_words & snippet_words) / len(claim_words)
-            if overlap > 0.3:
-                match_count += 1
+        if claim_words:
+            for source in sources:
+                overlap = len(claim_words & _word_set(source['snippet'])) / len(claim_words)
+                if overlap > 0.3:
+                    match_count += 1
         
         if match_count >= 2:
             verdict = "supported"
@@ -489,25 +1011,26 @@ class ReportEvaluator:
         )
     
     def score_report(self, draft: str, criteria: Criteria, 
-                    fact_checks: List[FactCheckResult]) -> EvaluationScore:
+                    fact_checks: List[FactCheckResult],
+                    verdict_counts: Optional[Counter] = None) -> EvaluationScore:
         """Calculate overall scores for the report"""
+        if verdict_counts is None:
+            verdict_counts = Counter(fc.verdict for fc in fact_checks)
         
         # Accuracy score based on fact-checking
-        supported = sum(1 for fc in fact_checks if fc.verdict == "supported")
+        supported = verdict_counts["supported"]
         total_claims = len(fact_checks) if fact_checks else 1
         accuracy = (supported / total_claims) * 5.0
         
         # Coverage score based on criteria
+        draft_lower = draft.lower()
         coverage_items = len(criteria.must_include) if criteria.must_include else 1
         covered = sum(1 for item in criteria.must_include 
-                     if item.lower() in draft.lower())
+                     if item.lower() in draft_lower)
         coverage = (covered / coverage_items) * 5.0
         
         # Citations quality
-        unique_sources = set()
-        for fc in fact_checks:
-            for source in fc.sources:
-                unique_sources.add(source['url'])
+        unique_sources = {source['url'] for fc in fact_checks for source in fc.sources}
         
         citations_quality = min(len(unique_sources) / 2, 5.0)  # More sources = better
         
@@ -551,34 +1074,30 @@ class ReportEvaluator:
         {draft[:2000]}
         
         Issues found:
-        {json.dumps([{'claim': i.claim, 'verdict': i.verdict} for i in issues], indent=2)}
+        {orjson.dumps([{'claim': i.claim, 'verdict': i.verdict} for i in issues], option=orjson.OPT_INDENT_2).decode()}
         
         Criteria to meet:
-        {json.dumps(asdict(criteria), indent=2)}
+        {orjson.dumps(asdict(criteria), option=orjson.OPT_INDENT_2).decode()}
         
         Return the corrected Markdown text.
         """
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant that rewrites drafts to correct errors and improve quality. Output clean Markdown text."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.5
-            }
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
-            return response.json()['choices'][0]['message']['content']
+            return self._chat_completion(
+                "You are a helpful assistant that rewrites drafts to correct errors and improve quality. Output clean Markdown text.",
+                prompt,
+                temperature=0.5,
+                use_cache=False  # sampled rewrite; a rerun should be able to differ
+            )
         except Exception as e:
             print(f"OpenAI auto-fix failed: {e}")
             return self._auto_fix_basic(draft, fact_checks)
     
+    async def auto_fix_draft_async(self, draft: str, criteria: Criteria,
+                                   fact_checks: List[FactCheckResult]) -> str:
+        """Auto-fix the draft on a worker thread without blocking the event loop"""
+        return await asyncio.to_thread(self.auto_fix_draft, draft, criteria, fact_checks)
+    
     def _auto_fix_basic(self, draft: str, fact_checks: List[FactCheckResult]) -> str:
         """Basic auto-fix without AI"""
         fixed = draft
@@ -598,71 +1117,123 @@ class ReportEvaluator:
         
         return fixed
     
-    def generate_report(self, user_query: str, draft: str, 
+    def generate_report(self, user_query: str, draft: Union[str, bytes], 
                        output_dir: Path) -> Dict[str, Any]:
         """Main evaluation pipeline"""
+        coro = self.generate_report_async(user_query, draft, output_dir)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Called from inside an event loop (Jupyter, async handlers), where
+        # asyncio.run refuses to start; run the pipeline on its own thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def generate_report_async(self, user_query: str, draft: Union[str, bytes],
+                                    output_dir: Path) -> Dict[str, Any]:
+        """Main evaluation pipeline, overlapping the independent network calls"""
+        
+        if isinstance(draft, bytes):
+            # Decoded once here; every later step works on the text
+            draft = draft.decode('utf-8')
+            if '\r' in draft:  # same newline handling as Path.read_text
+                draft = draft.replace('\r\n', '\n').replace('\r', '\n')
         
         print("[INFO] Starting evaluation pipeline...")
+        # One timestamp shared by every output file of this run
+        generated_at = datetime.now().isoformat()
         
-        # Step 1: Extract criteria
+        # Step 1: Extract criteria (runs alongside steps 2-3)
         print("[1/6] Extracting evaluation criteria...")
-        criteria = self.extract_criteria(user_query)
+        criteria_task = asyncio.create_task(self.extract_criteria_async(user_query))
         
-        # Step 2: Extract claims
+        # Steps 2-3: Extract claims and fact-check them as they stream in
         print("[2/6] Extracting claims from draft...")
-        claims = self.extract_claims(draft)
-        print(f"      Found {len(claims)} claims to verify")
-        
-        # Step 3: Fact-check claims
-        print("[3/6] Fact-checking claims...")
-        fact_checks = []
-        for i, claim in enumerate(claims[:10], 1):  # Limit to 10 for performance
-            print(f"      Checking claim {i}/{min(len(claims), 10)}...")
-            fact_check = self.fact_check_claim(claim)
-            fact_checks.append(fact_check)
+        print("[3/6] Fact-checking claims as they are extracted...")
+        # Limit to 10 fact-checks for performance
+        claims, fact_checks = await self._extract_and_fact_check_async(draft, limit=10)
+        print(f"      Found {len(claims)} claims, checked {len(fact_checks)}")
+        criteria = await criteria_task
         
         # Step 4: Score the report
         print("[4/6] Calculating scores...")
-        score = self.score_report(draft, criteria, fact_checks)
+        verdict_counts = Counter(fc.verdict for fc in fact_checks)
+        score = self.score_report(draft, criteria, fact_checks, verdict_counts)
         
         # Step 5: Auto-fix if needed
         fixed_draft = draft
         if score.overall < 3.5:
             print("[5/6] Auto-fixing draft (score below 3.5)...")
-            fixed_draft = self.auto_fix_draft(draft, criteria, fact_checks)
+            fixed_draft = await self.auto_fix_draft_async(draft, criteria, fact_checks)
         
         # Generate outputs
         print("[6/6] Generating reports...")
-        self._save_markdown_report(
-            user_query, draft, fixed_draft, criteria, 
-            fact_checks, score, output_dir
-        )
-        self._save_html_report(
-            user_query, draft, fixed_draft, criteria,
-            fact_checks, score, output_dir
-        )
-        self._save_json_report(
+        await asyncio.to_thread(
+            self._save_reports,
             user_query, draft, fixed_draft, criteria,
-            fact_checks, score, output_dir
+            fact_checks, score, output_dir, verdict_counts, generated_at
         )
         
         return {
             "score": asdict(score),
             "criteria": asdict(criteria),
-            "fact_checks": [asdict(fc) for fc in fact_checks],
+            # Sources are copied: the search cache holds the same dicts
+            "fact_checks": [
+                {k: [dict(source) for source in fc.sources] if k == "sources" else getattr(fc, k)
+                 for k in _FC_FIELDS}
+                for fc in fact_checks
+            ],
             "fixed_draft": fixed_draft,
             "output_files": {
                 "markdown": str(output_dir / "report.md"),
                 "html": str(output_dir / "report.html"),
-                "json": str(output_dir / "report.json")
+                "json": str(output_dir / "report.json"),
+                "fact_checks": str(output_dir / "fact_checks.jsonl") if fact_checks else None
             }
         }
     
+    def _save_reports(self, query, original, fixed, criteria,
+                      fact_checks, score, output_dir, verdict_counts,
+                      generated_at):
+        """Write the Markdown, HTML and JSON reports"""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # The writers touch separate files, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            writers = [
+                executor.submit(
+                    self._save_markdown_report,
+                    query, original, fixed, criteria,
+                    fact_checks, score, output_dir, verdict_counts
+                ),
+                executor.submit(
+                    self._save_html_report,
+                    query, original, fixed, criteria,
+                    fact_checks, score, output_dir, generated_at
+                ),
+                executor.submit(
+                    self._save_json_report,
+                    query, original, fixed, criteria,
+                    fact_checks, score, output_dir, generated_at
+                ),
+            ]
+            if fact_checks:
+                writers.append(executor.submit(
+                    self._save_fact_checks_jsonl,
+                    fact_checks, output_dir
+                ))
+            else:
+                # Don't leave an earlier run's file behind in a reused directory
+                (output_dir / "fact_checks.jsonl").unlink(missing_ok=True)
+            for writer in writers:
+                writer.result()
+    
     def _save_markdown_report(self, query, original, fixed, criteria, 
-                             fact_checks, score, output_dir):
+                             fact_checks, score, output_dir, verdict_counts):
         """Save Markdown report"""
         
-        report = f"""# Evaluation Report
+        buf = io.StringIO()
+        buf.write(f"""# Evaluation Report
 
 ## Query
 {query}
@@ -685,197 +1256,124 @@ class ReportEvaluator:
 Total claims checked: {len(fact_checks)}
 
 ### Summary
-- [SUPPORTED]: {sum(1 for fc in fact_checks if fc.verdict == 'supported')}
-- [CONTRADICTED]: {sum(1 for fc in fact_checks if fc.verdict == 'contradicted')}
-- [INSUFFICIENT]: {sum(1 for fc in fact_checks if fc.verdict == 'insufficient')}
+- [SUPPORTED]: {verdict_counts['supported']}
+- [CONTRADICTED]: {verdict_counts['contradicted']}
+- [INSUFFICIENT]: {verdict_counts['insufficient']}
 
 ### Details
-"""
+""")
         
         for i, fc in enumerate(fact_checks[:5], 1):
-            report += f"""
+            buf.write(f"""
 #### Claim {i}
 **Statement**: {fc.claim[:100]}...
 **Verdict**: {fc.verdict} (confidence: {fc.confidence:.2f})
 **Rationale**: {fc.rationale}
-"""
+""")
         
-        if score.overall < 3.5:
-            report += f"""
+        if score.overall < 3.5 and fixed != original:
+            buf.write(f"""
 ## Auto-Fixed Version
 The original draft scored below 3.5 and has been automatically corrected:
 
 {fixed}
-"""
+""")
         
-        report += f"""
+        buf.write("""
 ## Sources Used for Verification
-"""
+""")
         
-        all_sources = set()
+        # One line per URL, in the order sources were first cited
+        source_titles = {}
         for fc in fact_checks:
             for source in fc.sources:
-                all_sources.add(f"- [{source['title']}]({source['url']})")
+                source_titles.setdefault(source['url'], source['title'])
         
-        report += "\n".join(all_sources)
+        buf.write("\n".join(f"- [{title}]({url})" for url, title in source_titles.items()))
         
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "report.md").write_text(report, encoding='utf-8')
+        (output_dir / "report.md").write_bytes(buf.getvalue().encode('utf-8'))
     
     def _save_html_report(self, query, original, fixed, criteria,
-                         fact_checks, score, output_dir):
+                         fact_checks, score, output_dir, generated_at):
         """Save HTML report"""
         
-        # Convert markdown to HTML
-        md_converter = markdown.Markdown(extensions=['extra', 'codehilite'])
-        
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Evaluation Report</title>
-    <style>
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 900px; 
-            margin: 0 auto; 
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1, h2, h3 {{ color: #333; }}
-        .score-badge {{
-            display: inline-block;
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-            margin: 5px;
-        }}
-        .score-good {{ background: #4caf50; color: white; }}
-        .score-medium {{ background: #ff9800; color: white; }}
-        .score-poor {{ background: #f44336; color: white; }}
-        .fact-check {{
-            margin: 10px 0;
-            padding: 15px;
-            border-left: 4px solid #2196F3;
-            background: #f0f8ff;
-        }}
-        .verdict-supported {{ border-color: #4caf50; background: #e8f5e9; }}
-        .verdict-contradicted {{ border-color: #f44336; background: #ffebee; }}
-        .verdict-insufficient {{ border-color: #ff9800; background: #fff3e0; }}
-        pre {{ background: #f4f4f4; padding: 10px; overflow-x: auto; }}
-        .toggle-section {{
-            cursor: pointer;
-            user-select: none;
-            padding: 10px;
-            background: #e0e0e0;
-            margin: 10px 0;
-        }}
-        .toggle-content {{
-            display: none;
-            padding: 10px;
-            border: 1px solid #ddd;
-        }}
-        .toggle-content.active {{
-            display: block;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Evaluation Report</h1>
-        
-        <h2>Query</h2>
-        <p>{query}</p>
-        
-        <h2>Evaluation Scores</h2>
-        <p>
-            <span class="score-badge {'score-good' if score.overall >= 4 else 'score-medium' if score.overall >= 3 else 'score-poor'}">
-                Overall: {score.overall:.2f}/5.00
-            </span>
-        </p>
-        <ul>
-            <li>Accuracy: {score.accuracy:.2f}/5.00 (45% weight)</li>
-            <li>Coverage: {score.coverage:.2f}/5.00 (30% weight)</li>
-            <li>Citations Quality: {score.citations_quality:.2f}/5.00 (15% weight)</li>
-            <li>Clarity & Structure: {score.clarity_structure:.2f}/5.00 (10% weight)</li>
-        </ul>
-        
-        <h2>Fact-Check Results</h2>
-        <p>Checked {len(fact_checks)} claims:</p>
-"""
-        
-        for i, fc in enumerate(fact_checks[:5], 1):
-            verdict_class = f"verdict-{fc.verdict}"
-            html += f"""
-        <div class="fact-check {verdict_class}">
-            <strong>Claim {i}:</strong> {fc.claim[:100]}...<br>
-            <strong>Verdict:</strong> {fc.verdict} (confidence: {fc.confidence:.2f})<br>
-            <strong>Rationale:</strong> {fc.rationale}
-        </div>
-"""
-        
-        if score.overall < 3.5:
-            html += f"""
-        <div class="toggle-section" onclick="toggleSection('fixed')">
-            ▶ Show Auto-Fixed Version
-        </div>
-        <div id="fixed" class="toggle-content">
-            {md_converter.convert(fixed)}
-        </div>
-"""
-        
-        html += """
-    </div>
-    <script>
-        function toggleSection(id) {
-            const content = document.getElementById(id);
-            content.classList.toggle('active');
-            const toggle = content.previousElementSibling;
-            toggle.textContent = content.classList.contains('active') ? 
-                '▼ Hide Auto-Fixed Version' : '▶ Show Auto-Fixed Version';
-        }
-    </script>
-</body>
-</html>
-"""
+        fact_checks_html = ''.join(
+            _HTML_FACT_CHECK_TMPL.format_map(_SafeDict(
+                index=i,
+                verdict=fc.verdict,
+                claim=fc.claim[:100],
+                confidence=fc.confidence,
+                rationale=fc.rationale
+            ))
+            for i, fc in enumerate(fact_checks[:5], 1)
+        )
         
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "report.html").write_text(html, encoding='utf-8')
+        # Auto-fix can leave the draft untouched; don't render it a second time
+        fixed_html = ""
+        if score.overall < 3.5 and fixed != original:
+            fixed_html = _HTML_FIXED_TMPL.format_map(_SafeDict(
+                fixed_html=_convert_md_cached(fixed)
+            ))
+        
+        if score.overall >= 4:
+            score_class = 'score-good'
+        elif score.overall >= 3:
+            score_class = 'score-medium'
+        else:
+            score_class = 'score-poor'
+        
+        body = _HTML_BODY_TMPL.format_map(_SafeDict(
+            query=query,
+            generated_at=generated_at,
+            score_class=score_class,
+            overall=score.overall,
+            accuracy=score.accuracy,
+            coverage=score.coverage,
+            citations_quality=score.citations_quality,
+            clarity_structure=score.clarity_structure,
+            claims_checked=len(fact_checks),
+            fact_checks_html=fact_checks_html,
+            fixed_html=fixed_html
+        ))
+        html = "".join((_HTML_HEADER, body, _TOGGLE_JS, _HTML_FOOTER))
+        
+        # The page is already complete, so write it straight to the fd
+        # without the buffered file object layers
+        data = memoryview(html.encode('utf-8'))
+        fd = os.open(output_dir / "report.html",
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     
     def _save_json_report(self, query, original, fixed, criteria,
-                         fact_checks, score, output_dir):
+                         fact_checks, score, output_dir, generated_at):
         """Save JSON report for programmatic access"""
-        
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "query": query,
-            "score": asdict(score),
-            "criteria": asdict(criteria),
-            "fact_checks": [
-                {
-                    "claim": fc.claim,
-                    "verdict": fc.verdict,
-                    "confidence": fc.confidence,
-                    "rationale": fc.rationale,
-                    "sources": fc.sources
-                }
-                for fc in fact_checks
-            ],
-            "original_draft_length": len(original),
-            "fixed_draft_length": len(fixed) if fixed != original else None,
-            "auto_fixed": score.overall < 3.5
-        }
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "report.json").write_text(
-            json.dumps(report, indent=2), 
-            encoding='utf-8'
+        encoded_fields = (
+            ("timestamp", orjson.dumps(generated_at)),
+            ("query", orjson.dumps(query)),
+            ("score", _encode_score(score)),
+            ("criteria", _encode_criteria(criteria)),
+            ("fact_checks_ref", b'"fact_checks.jsonl"' if fact_checks else b"null"),
+            ("original_draft_length", orjson.dumps(len(original))),
+            ("fixed_draft_length", orjson.dumps(len(fixed) if fixed != original else None)),
+            ("auto_fixed", orjson.dumps(score.overall < 3.5 and fixed != original)),
         )
+        
+        with open(output_dir / "report.json", "wb", buffering=65536) as f:
+            f.write(b"{")
+            for i, (name, value) in enumerate(encoded_fields):
+                f.write(b"," if i else b"")
+                f.write(b'\n  "%s": %s' % (name.encode(), value))
+            f.write(b"\n}")
+    
+    def _save_fact_checks_jsonl(self, fact_checks, output_dir):
+        """Save fact-checks as one JSON record per line"""
+        with open(output_dir / "fact_checks.jsonl", "wb", buffering=65536) as f:
+            for fc in fact_checks:
+                f.write(orjson.dumps({k: getattr(fc, k) for k in _FC_FIELDS}) + b"\n")
 
 
 def main():
@@ -898,6 +1396,11 @@ def main():
         default="evaluation_output",
         help="Output directory for reports"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the full traceback on errors"
+    )
     
     args = parser.parse_args()
     
@@ -907,7 +1410,7 @@ def main():
         print(f"Error: Draft file not found: {args.draft}")
         sys.exit(1)
     
-    draft_content = draft_path.read_text(encoding='utf-8')
+    draft_content = draft_path.read_bytes()
     
     # Create evaluator and run
     evaluator = ReportEvaluator()
@@ -920,18 +1423,22 @@ def main():
             output_dir
         )
         
-        print("\n[SUCCESS] Evaluation complete!")
-        print(f"[SCORE] Overall Score: {results['score']['overall']:.2f}/5.00")
-        print(f"[OUTPUT] Reports saved to: {output_dir}")
+        sys.stdout.write(
+            "\n[SUCCESS] Evaluation complete!\n"
+            f"[SCORE] Overall Score: {results['score']['overall']:.2f}/5.00\n"
+            f"[OUTPUT] Reports saved to: {output_dir}\n"
+        )
         
         # Return non-zero exit code if score is poor
         if results['score']['overall'] < 3.0:
             sys.exit(2)  # Indicates poor quality
             
     except Exception as e:
-        print(f"[ERROR] Error during evaluation: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose or os.getenv("REPORT_EVAL_DEBUG"):
+            import traceback
+            traceback.print_exc()
+        else:
+            print(f"[ERROR] {type(e).__name__}: {e}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -4,32 +4,71 @@ Test script to verify OpenAI integration in evaluator.py
 """
 
 import os
+import sys
 import json
-from dotenv import load_dotenv
+import argparse
+import functools
 
-# Load environment variables
-load_dotenv()
+# Shared keep-alive session, created on first use so the script starts
+# without importing requests
+_SESSION = None
 
+def _get_session():
+    """Return the shared session, creating it on first call"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session()
+        _SESSION.headers.update({"Content-Type": "application/json"})
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return _SESSION
+
+# Output lines queued by _log and written in one go per test
+_OUTPUT = []
+
+def _log(message=""):
+    """Queue a line of output"""
+    _OUTPUT.append(message)
+
+def _flush_log():
+    """Write all queued output with a single write"""
+    if _OUTPUT:
+        sys.stdout.write("\n".join(_OUTPUT) + "\n")
+        sys.stdout.flush()
+        _OUTPUT.clear()
+
+def _buffered_output(func):
+    """Flush everything a function logs when it returns"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush_log()
+    return wrapper
+
+@_buffered_output
 def test_openai_connection():
     """Test if OpenAI API is accessible"""
-    import requests
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
     
     api_key = os.getenv('OPENAI_API_KEY')
     model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
     
     if not api_key:
-        print("❌ OPENAI_API_KEY not found in environment variables")
-        print("   Please add it to your .env file")
+        _log("❌ OPENAI_API_KEY not found in environment variables")
+        _log("   Please add it to your .env file")
         return False
     
-    print(f"✓ Found OPENAI_API_KEY in environment")
-    print(f"✓ Using model: {model}")
+    _log(f"✓ Found OPENAI_API_KEY in environment")
+    _log(f"✓ Using model: {model}")
     
     # Test API connection
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    headers = {"Authorization": f"Bearer {api_key}"}
     
     test_data = {
         "model": model,
@@ -40,9 +79,12 @@ def test_openai_connection():
         "temperature": 0
     }
     
+    import requests
+    
     try:
-        print("\n🔄 Testing OpenAI API connection...")
-        response = requests.post(
+        _log("\n🔄 Testing OpenAI API connection...")
+        _flush_log()  # show progress before the request blocks
+        response = _get_session().post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=test_data,
@@ -52,83 +94,100 @@ def test_openai_connection():
         if response.status_code == 200:
             result = response.json()
             message = result['choices'][0]['message']['content']
-            print(f"✅ Success! Response: {message}")
+            _log(f"✅ Success! Response: {message}")
             return True
         elif response.status_code == 401:
-            print("❌ Authentication failed - check your API key")
+            _log("❌ Authentication failed - check your API key")
         elif response.status_code == 404:
-            print(f"❌ Model '{model}' not found - check OPENAI_MODEL in .env")
+            _log(f"❌ Model '{model}' not found - check OPENAI_MODEL in .env")
         elif response.status_code == 429:
-            print("❌ Rate limit exceeded or insufficient credits")
+            _log("❌ Rate limit exceeded or insufficient credits")
         else:
-            print(f"❌ API request failed: {response.status_code}")
-            print(f"   Response: {response.text}")
+            _log(f"❌ API request failed: {response.status_code}")
+            _log(f"   Response: {response.text}")
         
         return False
         
     except requests.exceptions.Timeout:
-        print("❌ Request timed out - check your internet connection")
+        _log("❌ Request timed out - check your internet connection")
         return False
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _log(f"❌ Error: {e}")
         return False
 
+@_buffered_output
 def test_evaluator_import():
     """Test if evaluator can be imported with OpenAI changes"""
     try:
-        print("\n🔄 Testing evaluator.py import...")
+        _log("\n🔄 Testing evaluator.py import...")
         from evaluator import ReportEvaluator
-        print("✅ Successfully imported ReportEvaluator")
+        _log("✅ Successfully imported ReportEvaluator")
         
         # Try to instantiate
         evaluator = ReportEvaluator()
-        print("✅ Successfully instantiated ReportEvaluator")
+        _log("✅ Successfully instantiated ReportEvaluator")
         
         # Check if OpenAI is configured
         if evaluator.api_key:
-            print(f"✅ OpenAI API key configured in evaluator")
-            print(f"✅ Using model: {evaluator.model}")
+            _log(f"✅ OpenAI API key configured in evaluator")
+            _log(f"✅ Using model: {evaluator.model}")
         else:
-            print("⚠️  No OpenAI API key - evaluator will use fallback mode")
+            _log("⚠️  No OpenAI API key - evaluator will use fallback mode")
         
         return True
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("   Make sure all Python dependencies are installed:")
-        print("   pip install -r requirements.txt")
+        _log(f"❌ Import error: {e}")
+        _log("   Make sure all Python dependencies are installed:")
+        _log("   pip install -r requirements.txt")
         return False
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _log(f"❌ Error: {e}")
         return False
 
+@_buffered_output
 def main():
     """Run all tests"""
-    print("=" * 50)
-    print("OpenAI Integration Test for Research Report Generator")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(
+        description="Check the OpenAI setup used by evaluator.py"
+    )
+    parser.add_argument(
+        "--skip-import",
+        action="store_true",
+        help="Only test the API connection, without loading the evaluator"
+    )
+    args = parser.parse_args()
+    
+    _log("=" * 50)
+    _log("OpenAI Integration Test for Research Report Generator")
+    _log("=" * 50)
     
     # Test 1: Check OpenAI connection
     api_ok = test_openai_connection()
     
     # Test 2: Check evaluator import
-    import_ok = test_evaluator_import()
+    import_ok = True if args.skip_import else test_evaluator_import()
     
     # Summary
-    print("\n" + "=" * 50)
-    print("Test Results:")
-    print("=" * 50)
+    _log("\n" + "=" * 50)
+    _log("Test Results:")
+    _log("=" * 50)
     
-    if api_ok and import_ok:
-        print("✅ All tests passed! The evaluator is ready to use with OpenAI.")
-        print("\nYou can now run:")
-        print("  python evaluator.py --query 'your query' --draft report.md --out results")
+    if args.skip_import:
+        if api_ok:
+            _log("✅ OpenAI API connection works (evaluator import skipped).")
+        else:
+            _log("❌ OpenAI API connection failed. Please check the errors above.")
+    elif api_ok and import_ok:
+        _log("✅ All tests passed! The evaluator is ready to use with OpenAI.")
+        _log("\nYou can now run:")
+        _log("  python evaluator.py --query 'your query' --draft report.md --out results")
     elif import_ok and not api_ok:
-        print("⚠️  Evaluator imports successfully but OpenAI API is not configured.")
-        print("The evaluator will work in fallback mode (basic pattern matching).")
-        print("\nTo enable AI features, add your OPENAI_API_KEY to the .env file.")
+        _log("⚠️  Evaluator imports successfully but OpenAI API is not configured.")
+        _log("The evaluator will work in fallback mode (basic pattern matching).")
+        _log("\nTo enable AI features, add your OPENAI_API_KEY to the .env file.")
     else:
-        print("❌ Some tests failed. Please check the errors above.")
+        _log("❌ Some tests failed. Please check the errors above.")
     
     return 0 if (api_ok and import_ok) else 1
 
@@ -278,6 +278,18 @@ export async function startServer(port: number = 3000): Promise<FastifyInstance>
             const jsonContent = await fs.readFile(jsonPath, 'utf-8');
             const evaluation = JSON.parse(jsonContent);
             
+            // Fact-checks are stored one JSON record per line next to the report
+            if (evaluation.fact_checks_ref) {
+              const factChecksPath = path.join(tempDir, evaluation.fact_checks_ref);
+              const factChecksContent = await fs.readFile(factChecksPath, 'utf-8');
+              evaluation.fact_checks = factChecksContent
+                .split('\n')
+                .filter((line: string) => line.trim())
+                .map((line: string) => JSON.parse(line));
+            } else {
+              evaluation.fact_checks = [];
+            }
+            
             // Clean up temp files
             await fs.rm(tempDir, { recursive: true, force: true });
             